@@ -362,11 +362,21 @@ class Replacer(object):
                              must be called to provide target replacement(s)
                              before :meth:`in_` is called
         """
-        self._replacements = ensure_iterable(replacements)
+        ensure_iterable(replacements)
+        self._has_replacements = is_mapping(replacements)
+
+        # keep our own copy of the mapping, so that the cached regexes
+        # cannot get out of sync with it if the caller modifies theirs
+        self._replacements = (dict(replacements) if self._has_replacements
+                              else replacements)
+        self._regexes = {}
 
     def with_(self, replacement):
         """Provide replacement for string "needles".
 
+        This takes time proportional to the number of needles,
+        and is done only once per :class:`Replacer`.
+
         :param replacement: Target replacement for needles given in constructor
         :return: The :class:`Replacement` object
 
@@ -374,10 +384,11 @@ class Replacer(object):
         :raise ReplacementError: If replacement has been already given
         """
         ensure_string(replacement)
-        if is_mapping(self._replacements):
+        if self._has_replacements:
             raise ReplacementError("string replacements already provided")
 
         self._replacements = dict.fromkeys(self._replacements, replacement)
+        self._has_replacements = True
         return self
 
     def in_(self, haystack):
@@ -393,7 +404,7 @@ class Replacer(object):
         from taipan.collections import dicts
 
         ensure_string(haystack)
-        if not is_mapping(self._replacements):
+        if not self._has_replacements:
             raise ReplacementError("string replacements not provided")
 
         # handle special cases
@@ -402,15 +413,29 @@ class Replacer(object):
         if len(self._replacements) == 1:
             return haystack.replace(*dicts.peekitem(self._replacements))
 
-        # construct a regex matching any of the needles in the order
-        # of descending length (to prevent issues if they contain each other)
-        or_ = haystack.__class__('|')
-        regex = join(or_, imap(
-            re.escape, sorted(self._replacements, key=len, reverse=True)))
-
         # do the substituion, looking up the replacement for every match
+        regex = self._get_regex(haystack.__class__)
         do_replace = lambda match: self._replacements[match.group()]
-        return re.sub(regex, do_replace, haystack)
+        return regex.sub(do_replace, haystack)
+
+    def _get_regex(self, string_class):
+        """Get the compiled regex matching any of the needles.
+
+        The regex is built only once for every string class
+        of the haystacks passed to :meth:`in_`.
+
+        :param string_class: Class of the haystack string
+        """
+        regex = self._regexes.get(string_class)
+        if regex is None:
+            # construct a regex matching any of the needles in the order
+            # of descending length (to prevent issues if they contain
+            # each other)
+            or_ = string_class('|')
+            regex = re.compile(join(or_, imap(
+                re.escape, sorted(self._replacements, key=len, reverse=True))))
+            self._regexes[string_class] = regex
+        return regex
 
 
 # Other
@@ -2,6 +2,13 @@
 Compatibility module to ensure :module:`unittest2` symbols are available.
 """
 try:
-    from unittest2 import *
+    import unittest2 as _unittest
+    _HAS_UNITTEST2 = True
 except ImportError:
-    from unittest import *
+    import unittest as _unittest
+    _HAS_UNITTEST2 = False
+
+
+__all__ = list(_unittest.__all__)
+
+globals().update((name, getattr(_unittest, name)) for name in __all__)
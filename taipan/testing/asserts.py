@@ -4,20 +4,23 @@ Additional asserts to supplement the :class:`TestCase` class.
 from taipan._compat import imap
 from taipan.collections import is_countable, is_iterable
 from taipan.lang import ABSENT
-from taipan.strings import BaseString, is_string
+from taipan.strings import BaseString
 
 
 __all__ = ['AssertsMixin']
 
 
+#: Sentinel for detecting exhausted iterators.
+_SENTINEL = object()
+
+
 class AssertsMixin(object):
     """Mixin providing additional assert methods."""
 
     def assertZero(self, argument, msg=None):
         """Assert that ``argument`` is equal to zero."""
-        if msg is None:
-            msg = "%r is not equal to zero" % (argument,)
-        self.assertEqual(0, argument, msg=msg)
+        if not 0 == argument:
+            self.__fail(msg, "%r is not equal to zero" % (argument,))
 
     def assertEmpty(self, argument, msg=None):
         """Assert that ``argument`` is an empty collection."""
@@ -27,10 +30,7 @@ class AssertsMixin(object):
             if not is_iterable(argument):
                 self.__fail(msg, "%r is not an iterable" % (argument,))
 
-            nonempty = False
-            for _ in argument:
-                nonempty = True
-                break
+            nonempty = next(iter(argument), _SENTINEL) is not _SENTINEL
 
         if nonempty:
             self.__fail(msg, "%r is not empty" % (argument,))
@@ -43,10 +43,7 @@ class AssertsMixin(object):
             if not is_iterable(argument):
                 self.__fail(msg, "%r is not an iterable" % (argument,))
 
-            empty = True
-            for _ in argument:
-                empty = False
-                break
+            empty = next(iter(argument), _SENTINEL) is _SENTINEL
 
         if empty:
             self.__fail(msg, "%r is empty" % (argument,))
@@ -208,6 +205,7 @@ class AssertsMixin(object):
 
     def __fail_unless_strings(self, arg):
         """Fail the test unless argument is a string or iterable thereof."""
-        if not is_string(arg):
-            if not (is_iterable(arg) and all(imap(is_string, arg))):
+        if not isinstance(arg, BaseString):
+            if not (is_iterable(arg) and
+                    all(isinstance(x, BaseString) for x in arg)):
                 self.fail("%r is not a string or iterable of strings" % (arg,))
@@ -1,8 +1,9 @@
 """
 Decorators for :class:`TestCase` methods.
 """
+import itertools
+
 from taipan.api.decorators import function_decorator, method_decorator
-from taipan.strings import ensure_string
 
 
 __all__ = [
@@ -13,35 +14,6 @@ __all__ = [
 ]
 
 
-class _StageMethod(object):
-    """Wrapper for methods that's been marked with the test stage decorator.
-
-    Those methods will be unwrapped by :class:`TestCaseMetaclass`
-    during creation of the test case class that defined them.
-    """
-    __slots__ = ['method', 'stage', 'order']
-
-    def __init__(self, method, stage, order):
-        self.method = method
-        self.stage = ensure_string(stage)
-        self.order = order
-
-    # We proxy most operations to the underlying method to support the use case
-    # when it's called / referenced / etc. even before test class is created.
-    # (It should be very, very rare, though).
-
-    def __call__(self, *args, **kwargs):
-        """Proxy calls to underlying method."""
-        return self.method(*args, **kwargs)
-
-    def __getattribute__(self, attr):
-        """Proxy attribute access to underlying method."""
-        if attr in _StageMethod.__slots__:
-            return object.__getattribute__(self, attr)
-        else:
-            return getattr(self.method, attr)
-
-
 class _StageDecorator(object):
     """Base for the decorators that are applicable to :class:`TestCase` methods
     that are to be invoked at various stages of running a test.
@@ -49,20 +21,20 @@ class _StageDecorator(object):
     #: Name of the test stage of this decorator.
     stage = None
 
-    #: Tracks the use counters of the specific decorator
+    #: Counts the uses of all stage decorators
     #: to reestablish the proper order of decorated methods.
-    use_counter = 0
+    _counter = itertools.count()
 
     def __call__(self, func):
         """Decorate a test case method,
         attaching the stage & order information to it.
-        """
-        class_ = self.__class__
-
-        counter = class_.use_counter
-        class_.use_counter = counter + 1
 
-        return _StageMethod(func, stage=class_.stage, order=counter)
+        The information is stored as ``__stage__`` attribute of the method,
+        to be read by :class:`TestCaseMetaclass` during creation
+        of the test case class that defined it.
+        """
+        func.__stage__ = (self.stage, next(_StageDecorator._counter))
+        return func
 
 
 # Specific stage decorators
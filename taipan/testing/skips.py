@@ -12,15 +12,22 @@ __all__ = [
 ]
 
 
+#: Decorator returned when the test should not be skipped.
+_identity = identity()
+
+#: Sentinel for detecting missing attributes.
+_MISSING = object()
+
+
 # TODO(xion): come up with better name
 def skipIfReturnsTrue(predicate):
     """Decorator that will cause a test to be skipped
     if given ``predicate`` callable evaluates to true.
     """
     if predicate():
-        desc = getattr(predicate, '__doc__', None) or repr(predicate)
+        desc = _describe_predicate(predicate)
         return skip("predicate evaluated to true: %s" % desc)
-    return identity()
+    return _identity
 
 
 def skipUnlessReturnsTrue(predicate):
@@ -28,28 +35,46 @@ def skipUnlessReturnsTrue(predicate):
     unless given ``predicate`` callable evaluates to true.
     """
     if not predicate():
-        desc = getattr(predicate, '__doc__', None) or repr(predicate)
+        desc = _describe_predicate(predicate)
         return skip("predicate evaluated to false: %s" % desc)
-    return identity()
+    return _identity
 
 # TODO(xion): seriously weigh pros & cons of having those
 skipIfReturnsFalse = skipUnlessReturnsTrue
 skipUnlessReturnsFalse = skipIfReturnsTrue
 
 
+def _describe_predicate(predicate):
+    """Describe given predicate for the purpose of a skip message.
+
+    This is only called when the test is actually being skipped,
+    as computing ``repr()`` of the predicate may be expensive.
+    """
+    return predicate.__doc__ or repr(predicate)
+
+
 def skipIfHasattr(obj, attr):
     """Decorator that will cause a test to be skipped
     if given ``object`` contains given ``attr``\ ibute.
     """
-    if hasattr(obj, attr):
+    if _has_attr(obj, attr):
         return skip("%r has attribute %r" % (obj, attr))
-    return identity()
+    return _identity
 
 
 def skipUnlessHasattr(obj, attr):
     """Decorator that will cause a test to be skipped
     unless given ``object`` contains given ``attr``\ ibute.
     """
-    if not hasattr(obj, attr):
+    if not _has_attr(obj, attr):
         return skip("%r does not have attribute %r" % (obj, attr))
-    return identity()
+    return _identity
+
+
+def _has_attr(obj, attr):
+    """Check whether given object has given attribute.
+
+    Unlike :func:`hasattr` in Python 2, only :class:`AttributeError`
+    is treated as the attribute being absent.
+    """
+    return getattr(obj, attr, _MISSING) is not _MISSING
@@ -1,17 +1,22 @@
 """
 Test case class with additional enhancements.
 """
-from taipan._compat import IS_PY3, metaclass
+import inspect
+from operator import itemgetter
+
+from taipan._compat import metaclass
 from taipan.collections import dicts
-from taipan.functional.functions import attr_func
 from taipan.testing._unittest import TestCase as _TestCase
 from taipan.testing.asserts import AssertsMixin
-from taipan.testing.decorators import _StageMethod
 
 
 __all__ = ['TestCase']
 
 
+#: Sort key for ``(order, method)`` pairs of test stage methods.
+_order_key = itemgetter(0)
+
+
 class TestCaseMetaclass(type):
     """Metaclass for :class:`TestCase`.
 
@@ -26,14 +31,28 @@ class TestCaseMetaclass(type):
         """Create the new subclass of :class:`TestCase`."""
         super_ = (bases[0] if bases else object).__mro__[0]
 
-        # for every test stage, gather methods adorned with its decorator,
-        # sort them by definition order and construct final stage method
-        for stage in meta.CLASS_STAGES + meta.INSTANCE_STAGES:
-            stage_method_wrappers = [
-                mw for mw in dicts.itervalues(dict_)
-                if isinstance(mw, _StageMethod) and mw.stage == stage
-            ]
-            if not stage_method_wrappers:
+        # gather methods adorned with test stage decorators,
+        # grouping them by their stage in a single pass over class attributes
+        stages = meta.CLASS_STAGES + meta.INSTANCE_STAGES
+        methods_by_stage = dict((stage, []) for stage in stages)
+        for value in dicts.itervalues(dict_):
+            if not inspect.isfunction(value):
+                continue
+            stage_info = getattr(value, '__stage__', None)
+            if stage_info is not None:
+                stage, order = stage_info
+                methods_by_stage[stage].append((order, value))
+
+        # most test cases don't use the test stage decorators at all
+        if not any(dicts.itervalues(methods_by_stage)):
+            return super(TestCaseMetaclass, meta).__new__(
+                meta, name, bases, dict_)
+
+        # for every test stage, sort its methods by definition order
+        # and construct final stage method
+        for stage in stages:
+            stage_methods = methods_by_stage[stage]
+            if not stage_methods:
                 continue  # no stage methods, may be custom setUp/tearDown/etc.
 
             # if setUp/tearDown/etc. method was defined AND corresponding
@@ -44,9 +63,9 @@ class TestCaseMetaclass(type):
                     "ambiguous test stage: either define {stage}() method or "
                     "use @{stage} decorator".format(stage=stage))
 
-            stage_method_wrappers.sort(key=attr_func('order'))
-            methods = [mw.method for mw in stage_method_wrappers]
-            dict_[stage] = meta._create_stage_method(stage, methods, super_)
+            stage_methods.sort(key=_order_key)
+            dict_[stage] = meta._create_stage_method(
+                stage, [method for _, method in stage_methods], super_)
 
         return super(TestCaseMetaclass, meta).__new__(meta, name, bases, dict_)
 
@@ -60,37 +79,46 @@ class TestCaseMetaclass(type):
 
         :return: Function that invokes all ``methods`` in given order.
         """
-        def invoke_methods(target):
-            for method in methods:
-                method(target)
+        if stage not in meta.CLASS_STAGES + meta.INSTANCE_STAGES:
+            raise ValueError("invalid test stage identifier: %r" % (stage,))
 
+        methods = tuple(methods)
+
+        # superclass' stage method is looked up once, and resulting function
+        # is specialized for setup or teardown to avoid branching on every call
+        super_method = getattr(super_, stage)
         is_setup = stage.startswith('setUp')
-        is_teardown = stage.startswith('tearDown')
 
         if stage in meta.CLASS_STAGES:
-            def class_method(cls):
-                if is_setup:
-                    getattr(super_, stage)()
-                invoke_methods(cls)
-                if is_teardown:
-                    getattr(super_, stage)()
+            # (``super_method`` is already bound to the superclass here)
+            if is_setup:
+                def class_method(cls):
+                    super_method()
+                    for method in methods:
+                        method(cls)
+            else:
+                def class_method(cls):
+                    for method in methods:
+                        method(cls)
+                    super_method()
 
             class_method.__name__ = stage
             class_method = classmethod(class_method)
             return class_method
 
-        if stage in meta.INSTANCE_STAGES:
+        if is_setup:
             def instance_method(self):
-                if is_setup:
-                    getattr(super_, stage)(self)
-                invoke_methods(self)
-                if is_teardown:
-                    getattr(super_, stage)(self)
-
-            instance_method.__name__ = stage
-            return instance_method
+                super_method(self)
+                for method in methods:
+                    method(self)
+        else:
+            def instance_method(self):
+                for method in methods:
+                    method(self)
+                super_method(self)
 
-        raise ValueError("invalid test stage identifier: %r" % (stage,))
+        instance_method.__name__ = stage
+        return instance_method
 
 
 @metaclass(TestCaseMetaclass)
@@ -103,7 +131,6 @@ class TestCase(_TestCase, AssertsMixin):
     """
     # Python 3 changes name of the following assert function,
     # so we provide backward and forward synonyms for compatibility
-    if IS_PY3:
-        assertItemsEqual = _TestCase.assertCountEqual
-    else:
-        assertCountEqual = _TestCase.assertItemsEqual
+    assertCountEqual = assertItemsEqual = (
+        getattr(_TestCase, 'assertCountEqual', None) or
+        _TestCase.assertItemsEqual)
@@ -2,10 +2,10 @@
 Tests for .algorithms module.
 """
 from collections import namedtuple
+from itertools import islice
 
-from taipan._compat import IS_PY3, izip, xrange
+from taipan._compat import IS_PY3, xrange
 from taipan.collections import dicts, is_iterable, is_sequence
-from taipan.collections.tuples import is_tuple
 from taipan.functional import functions ; attr_func = functions.attr_func
 from taipan.testing import TestCase
 
@@ -26,10 +26,14 @@ class _Algorithm(TestCase):
 class Batch(_Algorithm):
     N = 3
 
-    WITHOUT_LEFTOVERS = [1, 2, 3, 4, 5, 6]
-    WITH_LEFTOVERS = [1, 2, 3, 4, 5]
+    WITHOUT_LEFTOVERS = (1, 2, 3, 4, 5, 6)
+    WITH_LEFTOVERS = (1, 2, 3, 4, 5)
     FILLVALUE = object()
 
+    BATCHED_WITHOUT_LEFTOVERS = [(1, 2, 3), (4, 5, 6)]
+    BATCHED_WITH_LEFTOVERS__TRIMMED = [(1, 2, 3), (4, 5)]
+    BATCHED_WITH_LEFTOVERS__PADDED = [(1, 2, 3), (4, 5, FILLVALUE)]
+
     def test_iterable__none(self):
         with self.assertRaises(TypeError):
             __unit__.batch(None, 1)
@@ -42,47 +46,19 @@ class Batch(_Algorithm):
         batched = __unit__.batch(self.WITHOUT_LEFTOVERS, self.N)
 
         self._assertGenerator(batched)
-        batched = list(batched)
-
-        self.assertEquals(
-            int(len(self.WITHOUT_LEFTOVERS) / self.N), len(batched))
-        for i, batch in enumerate(batched):
-            self._assertTuple(batch)
-            self.assertEquals(self.N, len(batch))
-            self.assertItemsEqual(
-                self.WITHOUT_LEFTOVERS[i * self.N:(i + 1) * self.N], batch)
+        self.assertEquals(self.BATCHED_WITHOUT_LEFTOVERS, list(batched))
 
     def test_iterable__with_leftovers__trimmed(self):
         batched = __unit__.batch(self.WITH_LEFTOVERS, self.N)
 
         self._assertGenerator(batched)
-        batched = list(batched)
-
-        self.assertEquals(
-            int(len(self.WITH_LEFTOVERS) / self.N) + 1, len(batched))
-        for i, batch in enumerate(batched):
-            self._assertTuple(batch)
-            self.assertGreaterEqual(self.N, len(batch))
-            self.assertItemsEqual(
-                self.WITH_LEFTOVERS[i * self.N:(i + 1) * self.N], batch)
+        self.assertEquals(self.BATCHED_WITH_LEFTOVERS__TRIMMED, list(batched))
 
     def test_iterable__with_leftovers__padded(self):
         batched = __unit__.batch(self.WITH_LEFTOVERS, self.N, self.FILLVALUE)
 
         self._assertGenerator(batched)
-        batched = list(batched)
-
-        self.assertEquals(
-            int(len(self.WITH_LEFTOVERS) / self.N) + 1, len(batched))
-        for i, batch in enumerate(batched):
-            self._assertTuple(batch)
-            self.assertEquals(self.N, len(batch))
-            for j, elem in enumerate(batch):
-                index = i * self.N + j
-                if index < len(self.WITH_LEFTOVERS):
-                    self.assertEquals(self.WITH_LEFTOVERS[index], elem)
-                else:
-                    self.assertIs(self.FILLVALUE, elem)
+        self.assertEquals(self.BATCHED_WITH_LEFTOVERS__PADDED, list(batched))
 
     def test_n__none(self):
         with self.assertRaises(TypeError):
@@ -101,15 +77,7 @@ class Batch(_Algorithm):
             self.WITHOUT_LEFTOVERS, len(self.WITHOUT_LEFTOVERS) + self.N)
 
         self._assertGenerator(batched)
-        batched = list(batched)
-
-        self.assertEquals(1, len(batched))
-        self.assertItemsEqual(self.WITHOUT_LEFTOVERS, batched[0])
-
-    # Assertions
-
-    def _assertTuple(self, obj):
-        self.assertTrue(is_tuple(obj), msg="%r is not a tuple" % (obj,))
+        self.assertEquals([self.WITHOUT_LEFTOVERS], list(batched))
 
 
 class Cycle(_Algorithm):
@@ -134,8 +102,8 @@ class Cycle(_Algorithm):
         cycled = __unit__.cycle(self.ITERABLE)
 
         # iterate for a few cycles and check if elements match
-        for i, elem in izip(xrange(self.LENGTH * self.CYCLES_COUNT), cycled):
-            self.assertEquals(self.ITERABLE[i % self.LENGTH], elem)
+        expected = self.ITERABLE * self.CYCLES_COUNT
+        self.assertEquals(expected, list(islice(cycled, len(expected))))
 
         # make sure there is still some more
         for _ in xrange(self.CYCLES_COUNT):
@@ -154,8 +122,8 @@ class Cycle(_Algorithm):
         cycled = __unit__.cycle(self.ITERABLE, self.CYCLES_COUNT)
 
         # iterate for an exactly the expected number of elements
-        for i, elem in izip(xrange(self.LENGTH * self.CYCLES_COUNT), cycled):
-            self.assertEquals(self.ITERABLE[i % self.LENGTH], elem)
+        expected = self.ITERABLE * self.CYCLES_COUNT
+        self.assertEquals(expected, list(islice(cycled, len(expected))))
 
         # make sure the cycled iterable has been exhausted this way
         with self.assertRaises(StopIteration):
@@ -213,17 +181,18 @@ class Iterate(_Algorithm):
 
     class Counter(object):
         """Simplest iterable that can tell how much it's been iterated over."""
+        __slots__ = ['max_count', 'current_count']
+
         def __init__(self, max_count=None):
-            self.max_count = max_count
+            self.max_count = float('inf') if max_count is None else max_count
             self.current_count = 0
 
         def __iter__(self):
             return self
 
         def next(self):
-            if self.max_count is not None:
-                if self.current_count >= self.max_count:
-                    raise StopIteration()
+            if self.current_count >= self.max_count:
+                raise StopIteration()
             self.current_count += 1
             return self.current_count
 
@@ -291,28 +260,29 @@ class Pad(_Algorithm):
         padded = __unit__.pad([])
 
         self._assertGenerator(padded)
-        for _, elem in izip(xrange(self.MUCH_MORE_THAN_LENGTH), padded):
-            self.assertIsNone(elem)
+        self.assertEquals([None] * self.MUCH_MORE_THAN_LENGTH,
+                          list(islice(padded, self.MUCH_MORE_THAN_LENGTH)))
 
     def test_pad__default(self):
         padded = __unit__.pad(self.ITERABLE)
 
         self._assertGenerator(padded)
-        for i, elem in izip(xrange(self.MUCH_MORE_THAN_LENGTH), padded):
-            if i < self.LENGTH:
-                self.assertIs(self.ITERABLE[i], elem)
-            else:
-                self.assertIsNone(elem)
+        self.assertEquals(self._padded(None),
+                          list(islice(padded, self.MUCH_MORE_THAN_LENGTH)))
 
     def test_pad__custom(self):
         padded = __unit__.pad(self.ITERABLE, with_=self.PADDING)
 
         self._assertGenerator(padded)
-        for i, elem in izip(xrange(self.MUCH_MORE_THAN_LENGTH), padded):
-            if i < self.LENGTH:
-                self.assertIs(self.ITERABLE[i], elem)
-            else:
-                self.assertIs(self.PADDING, elem)
+        self.assertEquals(self._padded(self.PADDING),
+                          list(islice(padded, self.MUCH_MORE_THAN_LENGTH)))
+
+    # Utility functions
+
+    def _padded(self, padding):
+        """Returns expected initial part of padded ``ITERABLE``."""
+        return self.ITERABLE + [padding] * (
+            self.MUCH_MORE_THAN_LENGTH - self.LENGTH)
 
 
 class Unique(_Algorithm):
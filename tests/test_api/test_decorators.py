@@ -1,5 +1,7 @@
 """
 Tests for the .api.decorators module.
+
+PYTEST_DONT_REWRITE
 """
 from taipan.testing import TestCase
 
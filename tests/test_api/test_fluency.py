@@ -1,5 +1,7 @@
 """
 Tests for .api.fluency module.
+
+PYTEST_DONT_REWRITE
 """
 from functools import reduce
 import operator
@@ -112,10 +114,10 @@ class Fluent(TestCase):
             def put(self, item):
                 self._items.append(item)
             def sum(self):
-                return reduce(operator.add, self._items[1:], self._items[0]) \
+                return sum(self._items) \
                     if self._items else None
             def product(self):
-                return reduce(operator.mul, self._items[1:], self._items[0]) \
+                return reduce(operator.mul, self._items) \
                     if self._items else None
 
         accum = Accumulator().put(1).put(2).put(3).put(4).put(5).put(6)
@@ -167,11 +169,11 @@ class Terminator(TestCase):
                 self._items.append(item)
             @__unit__.terminator
             def sum(self):
-                return reduce(operator.add, self._items[1:], self._items[0]) \
+                return sum(self._items) \
                     if self._items else None
             @__unit__.terminator
             def product(self):
-                return reduce(operator.mul, self._items[1:], self._items[0]) \
+                return reduce(operator.mul, self._items) \
                     if self._items else None
 
         accum = Accumulator().put(1).put(2).put(3).put(4).put(5).put(6)
@@ -1,5 +1,7 @@
 """
 Tests for .api.properties module.
+
+PYTEST_DONT_REWRITE
 """
 from taipan.testing import TestCase
 
@@ -514,6 +514,9 @@ class Replace(TestCase):
     MAP_REPLACEMENTS = {"foo": "blah", "baz": "thud"}
     MAP_RESULT = "blahXbarXthudXbar"
 
+    OTHER_HAYSTACK = "bazYquxYfoo"
+    OTHER_MAP_RESULT = "thudYquxYblah"
+
     def test_needle__none(self):
         with self.assertRaises(TypeError) as r:
             __unit__.replace(None)
@@ -671,6 +674,24 @@ class Replace(TestCase):
         result = __unit__.replace(self.MAP_REPLACEMENTS).in_(self.HAYSTACK)
         self.assertEquals(self.MAP_RESULT, result)
 
+    def test_replace__many_haystacks(self):
+        replacer = __unit__.replace(self.MAP_REPLACEMENTS)
+        self.assertEquals(self.MAP_RESULT, replacer.in_(self.HAYSTACK))
+
+        regex = replacer._get_regex(self.HAYSTACK.__class__)
+        self.assertEquals(self.OTHER_MAP_RESULT,
+                          replacer.in_(self.OTHER_HAYSTACK))
+        self.assertIs(
+            regex, replacer._get_regex(self.OTHER_HAYSTACK.__class__))
+
+    def test_replace__map__modified_after_use(self):
+        replacements = self.MAP_REPLACEMENTS.copy()
+        replacer = __unit__.replace(replacements)
+        self.assertEquals(self.MAP_RESULT, replacer.in_(self.HAYSTACK))
+
+        del replacements['baz']
+        self.assertEquals(self.MAP_RESULT, replacer.in_(self.HAYSTACK))
+
     # Utility functions
 
     def _assertReplacer(self, arg, replacements=None):
@@ -1,6 +1,7 @@
 """
 Tests for the assertion methods from the .testing package.
 """
+from itertools import count
 import operator
 
 from taipan._compat import IS_PY3
@@ -412,6 +413,10 @@ class AssertAll(_IterableAssertion):
         with self._assertFailure():
             self._TESTCASE.assertAll(self.ALL_FALSE)
 
+    def test_iterable__infinite(self):
+        with self._assertFailure():
+            self._TESTCASE.assertAll(count())  # first element is zero
+
     def test_predicate__empty_iterable(self):
         self._TESTCASE.assertAll(self.IS_POSITIVE, ())
         self._TESTCASE.assertAll(self.IS_NEGATIVE, ())
@@ -442,6 +447,19 @@ class AssertAll(_IterableAssertion):
         with self._assertFailure():
             self._TESTCASE.assertAll(self.IS_NEGATIVE, self.POSITIVES)
 
+    def test_predicate__infinite_iterable(self):
+        with self._assertFailure():
+            self._TESTCASE.assertAll(self.IS_NEGATIVE, count(1))
+
+    def test_predicate__evaluated_once_per_element(self):
+        evaluated = []
+        def predicate(x):
+            evaluated.append(x)
+            return x > 1
+        with self._assertFailure():
+            self._TESTCASE.assertAll(predicate, [1, 2])
+        self.assertEqual([1], evaluated)
+
 
 class AssertAny(_IterableAssertion):
 
@@ -544,3 +562,4 @@ class AssertResultsEqual(_Assertion):
     def test_variable_functions(self):
         with self._assertFailure():
             self._TESTCASE.assertResultsEqual(self.VARIABLE, self.VARIABLE)
+
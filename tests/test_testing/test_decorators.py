@@ -128,6 +128,18 @@ class SetUp(_StageDecorators):
         self.assertEquals(self._lines(setup_texts, TEST_TEXT),
                           self._run_tests(TestCase))
 
+    def test_setUp_method_called_directly(self):
+        class TestCase(_StageDecorators.TestCase):
+            @__unit__.setUp
+            def print_setUp_text(self):
+                self._print(SETUP_TEXT)
+
+            def test_print(self):
+                self.print_setUp_text()
+
+        self.assertEquals(self._lines(SETUP_TEXT, SETUP_TEXT),
+                          self._run_tests(TestCase))
+
 
 class TearDown(_StageDecorators):
 
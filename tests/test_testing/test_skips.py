@@ -0,0 +1,94 @@
+"""
+Tests for the test skipping decorators.
+"""
+from taipan.testing import TestCase
+
+import taipan.testing.skips as __unit__
+
+
+class _Skip(TestCase):
+    """Base class for test cases for skipping decorators."""
+
+    def _create_test(self):
+        def test():
+            pass
+        return test
+
+    def _assertSkipped(self, test):
+        self.assertTrue(getattr(test, '__unittest_skip__', False),
+                        msg="%r would not be skipped" % (test,))
+
+    def _assertNotSkipped(self, test):
+        self.assertFalse(getattr(test, '__unittest_skip__', False),
+                         msg="%r would be skipped" % (test,))
+
+
+class SkipIfReturnsTrue(_Skip):
+
+    def test_predicate__true(self):
+        test = __unit__.skipIfReturnsTrue(lambda: True)(self._create_test())
+        self._assertSkipped(test)
+
+    def test_predicate__false(self):
+        test = __unit__.skipIfReturnsTrue(lambda: False)(self._create_test())
+        self._assertNotSkipped(test)
+
+    def test_predicate__evaluated_every_time(self):
+        results = [True, False]
+        predicate = lambda: results.pop(0)
+
+        self._assertSkipped(
+            __unit__.skipIfReturnsTrue(predicate)(self._create_test()))
+        self._assertNotSkipped(
+            __unit__.skipIfReturnsTrue(predicate)(self._create_test()))
+
+
+class SkipUnlessReturnsTrue(_Skip):
+
+    def test_predicate__true(self):
+        test = __unit__.skipUnlessReturnsTrue(
+            lambda: True)(self._create_test())
+        self._assertNotSkipped(test)
+
+    def test_predicate__false(self):
+        test = __unit__.skipUnlessReturnsTrue(
+            lambda: False)(self._create_test())
+        self._assertSkipped(test)
+
+    def test_predicate__evaluated_every_time(self):
+        results = [False, True]
+        predicate = lambda: results.pop(0)
+
+        self._assertSkipped(
+            __unit__.skipUnlessReturnsTrue(predicate)(self._create_test()))
+        self._assertNotSkipped(
+            __unit__.skipUnlessReturnsTrue(predicate)(self._create_test()))
+
+
+class SkipIfHasattr(_Skip):
+
+    class Object(object):
+        pass
+
+    def test_attribute__present(self):
+        obj = self.Object()
+        obj.foo = 42
+        test = __unit__.skipIfHasattr(obj, 'foo')(self._create_test())
+        self._assertSkipped(test)
+
+    def test_attribute__absent(self):
+        test = __unit__.skipIfHasattr(
+            self.Object(), 'foo')(self._create_test())
+        self._assertNotSkipped(test)
+
+    def test_attribute__hidden_by_getattribute(self):
+        class Object(object):
+            def __getattribute__(self, name):
+                if name == 'foo':
+                    raise AttributeError(name)
+                return super(Object, self).__getattribute__(name)
+
+        obj = Object()
+        obj.foo = 42  # present in __dict__ but not accessible
+        test = __unit__.skipIfHasattr(obj, 'foo')(self._create_test())
+        self._assertNotSkipped(test)